@@ -0,0 +1,246 @@
+import streamlit as st
+import os
+import asyncio
+import tempfile
+import threading
+from datetime import datetime
+import time
+from typing import List, Dict, Any
+
+# Import the multi-agent system
+from multi_agent_architecture import (
+    get_fused_analysis_agent,
+    get_industry_agent,
+    get_use_case_agent,
+    get_resource_agent,
+    get_proposal_generator,
+    ProgressCallbackHandler
+)
+
+# Configure page
+st.set_page_config(
+    page_title="AI Use Case Generator",
+    page_icon="🤖",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+@st.cache_resource
+def get_background_loop():
+    """One persistent event loop for all async work in this process.
+
+    The shared httpx connection pool is bound to the loop its connections
+    were created on, so running each click under a fresh asyncio.run loop
+    would leave the pool pointing at closed loops. Every coroutine is
+    instead submitted to this single long-lived loop.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+def stream_on_background_loop(agen):
+    """Drive an async generator on the persistent loop, yielding synchronously."""
+    loop = get_background_loop()
+    while True:
+        try:
+            yield asyncio.run_coroutine_threadsafe(agen.__anext__(), loop).result()
+        except StopAsyncIteration:
+            return
+
+@st.cache_resource
+def get_agents():
+    """Build the agents once per process; each holds a persistent OpenAI client."""
+    return (
+        get_fused_analysis_agent(),
+        get_industry_agent(),
+        get_use_case_agent(),
+        get_resource_agent(),
+        get_proposal_generator()
+    )
+
+async def run_agents(agents, company_or_industry, context, progress_handler):
+    """Run the analysis stages; progress is reported through LangChain callbacks.
+
+    Runs in a background thread, so no Streamlit calls are allowed here.
+    """
+    (fused_analysis_agent, industry_research_agent, use_case_generation_agent,
+     resource_collection_agent, _) = agents
+    callbacks = [progress_handler]
+
+    # Fused path: research, use cases, and resources in a single LLM call
+    stage_results = await fused_analysis_agent.analyze(company_or_industry, context, callbacks=callbacks)
+
+    if not stage_results:
+        # Staged fallback when the fused response cannot be split into sections
+        research_results, industry_trends = await asyncio.gather(
+            industry_research_agent.research(company_or_industry, context, callbacks=callbacks),
+            use_case_generation_agent.search_industry_trends(company_or_industry)
+        )
+
+        use_case_context = f"{context}\n\nCurrent industry AI trends:\n{industry_trends}".strip()
+        use_case_results = await use_case_generation_agent.generate_use_cases(
+            research_results, use_case_context, callbacks=callbacks
+        )
+        resource_results = await resource_collection_agent.collect_resources(
+            use_case_results, context, callbacks=callbacks
+        )
+        stage_results = {
+            "research_results": research_results,
+            "use_case_results": use_case_results,
+            "resource_results": resource_results
+        }
+
+    # The final proposal is streamed token-by-token in its tab rather than
+    # generated here, so the user sees output within seconds.
+    return stage_results
+
+# Rough token budget for a full analysis, used to scale the progress bar.
+ESTIMATED_PROGRESS_EVENTS = 3000
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def run_cached_analysis(company_or_industry, context):
+    """Cache full runs for an hour so re-clicks with identical inputs are instant.
+
+    The pipeline runs in a background thread while the main thread polls the
+    callback counter, so the progress bar moves during the long LLM waits
+    instead of jumping between hardcoded milestones.
+    """
+    progress_bar = st.progress(0.0)
+    status_text = st.empty()
+    status_text.text("Analyzing industry, use cases, and resources...")
+
+    agents = get_agents()
+    progress_handler = ProgressCallbackHandler()
+    future = asyncio.run_coroutine_threadsafe(
+        run_agents(agents, company_or_industry, context, progress_handler),
+        get_background_loop()
+    )
+    while not future.done():
+        time.sleep(0.2)
+        progress_bar.progress(min(0.95, progress_handler.events / ESTIMATED_PROGRESS_EVENTS))
+    stage_results = future.result()
+
+    progress_bar.progress(1.0)
+    status_text.text("Analysis complete! The final proposal streams in its tab.")
+    return stage_results
+
+# App title and description
+st.title("🤖 AI Use Case Generation System")
+st.markdown("""
+This system helps you identify and explore AI/ML/GenAI use cases for your company or industry.
+Simply enter your company or industry name, and our multi-agent system will:
+- Research your industry and business model
+- Generate relevant AI use cases tailored to your needs
+- Collect implementation resources and datasets
+- Create a comprehensive proposal with actionable insights
+""")
+
+# Sidebar for inputs
+st.sidebar.header("Input Parameters")
+
+company_or_industry = st.sidebar.text_input(
+    "Company or Industry Name",
+    help="Enter the name of your company or industry (e.g., 'Tesla' or 'Healthcare')"
+)
+
+context = st.sidebar.text_area(
+    "Additional Context (Optional)",
+    help="Provide any specific goals, challenges, or requirements for the AI implementation"
+)
+
+run_button = st.sidebar.button("Generate AI Use Cases")
+
+# Add architecture diagram
+st.sidebar.header("System Architecture")
+st.sidebar.markdown("""
+```
+User Input → Industry Research Agent → Use Case Generation Agent → Resource Collection Agent → Final Proposal
+```
+""")
+
+# Main content area with tabs
+tab1, tab2, tab3, tab4 = st.tabs(["Industry Research", "AI Use Cases", "Implementation Resources", "Final Proposal"])
+
+# Run the system when button is clicked
+if run_button and company_or_industry:
+    with st.spinner(f"Analyzing {company_or_industry}... This may take several minutes."):
+        try:
+            # Store in session state
+            results = run_cached_analysis(company_or_industry, context)
+            st.session_state.results = results
+            st.session_state.final_proposal = None
+            
+            # Generate file names with timestamp
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            company_slug = company_or_industry.lower().replace(" ", "_")
+            markdown_filename = f"{company_slug}_{timestamp}_proposal.md"
+            
+            st.session_state.markdown_filename = markdown_filename
+            st.session_state.has_results = True
+            
+            st.success("Analysis complete! See the tabs for detailed results.")
+        except Exception as e:
+            st.error(f"An error occurred: {str(e)}")
+            st.session_state.has_results = False
+elif run_button:
+    st.warning("Please enter a company or industry name.")
+
+# Display results if available
+if 'has_results' in st.session_state and st.session_state.has_results:
+    results = st.session_state.results
+    
+    # Tab 1: Industry Research
+    with tab1:
+        st.header(f"Industry Research: {results['research_results']['company_or_industry']}")
+        st.markdown(results['research_results']['research_results'])
+    
+    # Tab 2: AI Use Cases
+    with tab2:
+        st.header("Recommended AI/GenAI Use Cases")
+        st.markdown(results['use_case_results']['use_cases'])
+    
+    # Tab 3: Implementation Resources
+    with tab3:
+        st.header("Implementation Resources")
+        st.markdown(results['resource_results']['resources'])
+    
+    # Tab 4: Final Proposal
+    with tab4:
+        st.header("Final AI Implementation Proposal")
+        if st.session_state.get('final_proposal'):
+            st.markdown(st.session_state.final_proposal)
+        else:
+            # Stream the proposal token-by-token on the first render and keep
+            # the accumulated text for reruns and the download button.
+            final_proposal_generator = get_agents()[-1]
+            st.session_state.final_proposal = st.write_stream(
+                stream_on_background_loop(
+                    final_proposal_generator.stream_proposal(
+                        results['research_results'],
+                        results['use_case_results'],
+                        results['resource_results']
+                    )
+                )
+            )
+
+        # Download buttons
+        st.download_button(
+            label="Download Proposal (Markdown)",
+            data=st.session_state.final_proposal,
+            file_name=st.session_state.markdown_filename,
+            mime="text/markdown"
+        )
+else:
+    # Default content for each tab
+    with tab1:
+        st.info("Enter a company or industry name and click 'Generate AI Use Cases' to begin.")
+    with tab2:
+        st.info("AI use cases will appear here after analysis.")
+    with tab3:
+        st.info("Implementation resources will appear here after analysis.")
+    with tab4:
+        st.info("The final proposal will appear here after analysis.")
+
+# Footer
+st.markdown("---")
+st.markdown("Developed by InstaResz Business Services Pvt. Ltd | AI Use Case Generation System")
@@ -0,0 +1,903 @@
+import os
+import io
+import time
+import string
+import asyncio
+from functools import cached_property, lru_cache
+from typing import List, Dict, Any
+from datetime import datetime
+import requests
+import json
+import argparse
+import httpx
+import jinja2
+import markdown
+from dotenv import load_dotenv
+from langchain.callbacks import FileCallbackHandler
+from langchain.callbacks.base import BaseCallbackHandler
+from langchain.prompts import ChatPromptTemplate
+from langchain_community.tools import DuckDuckGoSearchRun
+from langchain_community.utilities import SerpAPIWrapper
+from langchain_core.exceptions import OutputParserException
+from langchain_openai import ChatOpenAI
+from openai import OpenAI
+from pydantic import BaseModel, Field, ValidationError
+
+# Load environment variables
+load_dotenv()
+
+# orjson serializes 3-10x faster than stdlib json, which LangChain uses
+# internally whenever large search-result payloads flow through a chain.
+# Patch the stdlib entry points so every caller in the process benefits;
+# fall back silently when orjson is not installed. orjson supports none
+# of stdlib's keyword options (strict=, cls=, indent=, ...), so any call
+# that passes one — e.g. langchain's loads(args, strict=strict) — is
+# delegated to the saved stdlib functions instead of crashing.
+try:
+    import orjson
+
+    _stdlib_dumps = json.dumps
+    _stdlib_loads = json.loads
+
+    def _orjson_dumps(obj, default=None, **kwargs):
+        if kwargs:
+            return _stdlib_dumps(obj, default=default, **kwargs)
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def _orjson_loads(s, **kwargs):
+        if kwargs:
+            return _stdlib_loads(s, **kwargs)
+        return orjson.loads(s)
+
+    json.dumps = _orjson_dumps
+    json.loads = _orjson_loads
+except ImportError:
+    pass
+
+# Per-stage model routing: research summarization and resource-link
+# formatting do not need frontier reasoning, so they default to the small
+# model; use case generation and the final proposal keep the large one.
+# Each stage can be upgraded independently via environment variables.
+RESEARCH_MODEL = os.getenv("RESEARCH_MODEL", "gpt-4o-mini")
+USE_CASE_MODEL = os.getenv("USE_CASE_MODEL", "gpt-4o")
+RESOURCE_MODEL = os.getenv("RESOURCE_MODEL", "gpt-4o-mini")
+FUSED_ANALYSIS_MODEL = os.getenv("FUSED_ANALYSIS_MODEL", "gpt-4o")
+PROPOSAL_MODEL = os.getenv("PROPOSAL_MODEL", "gpt-4o")
+
+# Stable reference guidance appended to every stage's system message.
+# OpenAI only auto-caches prompt prefixes of at least 1024 tokens; the
+# per-stage instructions alone sit around 250-350 tokens, so this block
+# pushes each static prefix past the threshold. It must never change
+# between runs and must contain no template variables, or the cache
+# stops matching.
+SHARED_PROMPT_GUIDANCE = """
+
+Reference guidance (apply throughout your answer):
+
+Implementation complexity rubric:
+- Low: built largely from off-the-shelf APIs or pre-trained models, needs little or no custom model training, uses data the company already collects in accessible form, and can reach a working pilot within weeks with a small team. Typical examples: document summarization with a hosted LLM, FAQ chatbots over existing knowledge bases, template-based report drafting.
+- Medium: requires meaningful data preparation or integration work across two or three internal systems, some model fine-tuning or retrieval pipeline construction, and coordination between a data team and the owning business unit. Pilots typically take one to three months. Typical examples: demand forecasting on historical sales data, retrieval-augmented assistants over proprietary document stores, customer churn scoring.
+- High: depends on data the company does not yet systematically collect, custom model development or significant MLOps investment, changes to frontline operating procedures, or regulatory review before deployment. Expect multi-quarter timelines and executive sponsorship. Typical examples: computer-vision quality inspection on a production line, real-time dynamic pricing, clinical or credit decision support.
+
+Benefit and ROI categories to consider for every use case: direct cost reduction (labor hours saved, waste or rework avoided), revenue growth (conversion, retention, upsell, faster time-to-market), risk reduction (compliance, fraud, safety incidents), capacity and throughput gains (more cases handled per person per day), and decision quality (forecast accuracy, fewer escalations). Prefer quantified ranges tied to an operational metric over vague claims; when a number cannot be grounded in the research, state the metric that should be baselined during a pilot instead of inventing a figure.
+
+Data readiness levels to reference when noting prerequisites: Level 1 means the required data is not collected today; Level 2 means it exists but is fragmented across systems or formats; Level 3 means it is centralized but unlabeled or of uneven quality; Level 4 means it is clean, governed, and ready for modeling. Name the level a use case requires and the level the company appears to be at, when the research supports a judgment.
+
+Resource quality criteria: prefer resources that are actively maintained (updated within roughly the last two years), come from recognizable sources (official vendor documentation, established open-source projects, major dataset hubs such as Kaggle or Hugging Face), and match the use case's domain rather than being generic. Every resource must carry a complete URL; never fabricate a link, and if no specific resource is known, recommend a concrete search strategy instead.
+
+Worked example of the expected use-case register: "Automated invoice triage - An LLM-based classifier routes inbound supplier invoices by type and flags mismatches against purchase orders. Problem: accounts-payable staff manually sort several thousand invoices a month, delaying payment and incurring late fees. Benefits: 60-80 percent reduction in manual sorting time, fewer duplicate payments, measurable via invoices processed per FTE per day. Complexity: Medium - requires integration with the ERP and two to three months of historical invoices for evaluation. Prerequisites: digitized invoices, an extraction step for scanned PDFs, finance-team review workflow for low-confidence cases."
+
+Writing style rules: use clear markdown headings and short bullet points; keep every claim traceable to the provided research or search results rather than general knowledge where possible; call out uncertainty explicitly instead of hedging silently; never include filler phrases about being an AI model; and keep section ordering exactly as requested so downstream consumers can rely on the structure."""
+
+# One HTTP/2 connection pool shared by every ChatOpenAI instance. Four
+# agents would otherwise each open their own TLS connection to OpenAI,
+# and concurrent requests can multiplex over a single HTTP/2 connection.
+SHARED_HTTP_CLIENT = httpx.AsyncClient(
+    http2=True,
+    timeout=60,
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+)
+
+# One Markdown converter reused across runs: building a fresh instance
+# re-initializes every extension on each call. Callers must reset() it
+# between conversions.
+MARKDOWN_CONVERTER = markdown.Markdown(extensions=["fenced_code", "tables"])
+
+# The report templates are compiled once at import; render() reuses the
+# AST. Header and footer are separate so the converted proposal body can
+# be written between them without re-templating the whole document.
+HTML_HEADER_TEMPLATE = jinja2.Template("""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>AI Use Case Proposal for {{ company_or_industry }}</title>
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; max-width: 900px; margin: 0 auto; padding: 20px; }
+        h1 { color: #2c3e50; }
+        h2 { color: #3498db; border-bottom: 1px solid #eee; padding-bottom: 10px; }
+        h3 { color: #2980b9; }
+        a { color: #3498db; text-decoration: none; }
+        a:hover { text-decoration: underline; }
+        .resource { background-color: #f8f9fa; padding: 10px; border-radius: 5px; margin-bottom: 10px; }
+        .use-case { border-left: 4px solid #3498db; padding-left: 15px; margin-bottom: 20px; }
+    </style>
+</head>
+<body>
+    <h1>AI/GenAI Implementation Proposal for {{ company_or_industry }}</h1>
+""")
+
+HTML_FOOTER_TEMPLATE = jinja2.Template("""    <footer>
+        <p>Generated on {{ generated_at }}</p>
+    </footer>
+</body>
+</html>
+""")
+
+# One search tool shared by every agent: a single HTTP session and cookie
+# jar instead of one per agent, and one place to apply the rate-limit cap.
+SHARED_SEARCH = DuckDuckGoSearchRun()
+
+# DuckDuckGo rate-limits aggressively after 5-6 rapid requests, so every
+# search in the app goes through one shared concurrency cap.
+SEARCH_MAX_CONCURRENCY = 4
+SEARCH_TIMEOUT_SECONDS = 30
+SEARCH_MAX_RETRIES = 3
+
+# Streamlit creates a fresh event loop on every rerun, so semaphores are
+# kept per loop instead of as a single module-level instance.
+_search_semaphores: Dict[Any, asyncio.Semaphore] = {}
+
+def _get_search_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    if loop not in _search_semaphores:
+        _search_semaphores[loop] = asyncio.Semaphore(SEARCH_MAX_CONCURRENCY)
+    return _search_semaphores[loop]
+
+_PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+
+def _normalize_query(query: str) -> str:
+    """Lowercase, strip punctuation, and collapse whitespace for cache keys."""
+    return " ".join(query.lower().translate(_PUNCTUATION_TABLE).split())
+
+@lru_cache(maxsize=256)
+def _search_normalized(query_normalized: str) -> str:
+    return SHARED_SEARCH.run(query_normalized)
+
+def cached_search(query: str) -> str:
+    """Run a search, serving near-identical repeat queries from an in-process cache.
+
+    The stages often issue overlapping queries (e.g. the same company name
+    with slightly different suffixes across research and trends searches);
+    each cache hit saves a 1-3 s DuckDuckGo round-trip and stays clear of
+    the rate-limit wall.
+    """
+    return _search_normalized(_normalize_query(query))
+
+async def bounded_search(query: str) -> str:
+    """Run a single search off the event loop, respecting the global concurrency cap.
+
+    Retries with exponential backoff when DuckDuckGo rate-limits or errors out.
+    """
+    async with _get_search_semaphore():
+        for attempt in range(SEARCH_MAX_RETRIES):
+            try:
+                return await asyncio.wait_for(
+                    asyncio.to_thread(cached_search, query),
+                    timeout=SEARCH_TIMEOUT_SECONDS
+                )
+            except Exception:
+                if attempt == SEARCH_MAX_RETRIES - 1:
+                    raise
+                await asyncio.sleep(2 ** attempt)
+
+async def batched_search(queries: List[str]) -> List[str]:
+    """Run several searches concurrently, bounded by the shared semaphore."""
+    return await asyncio.gather(*(bounded_search(query) for query in queries))
+
+
+class ProgressCallbackHandler(BaseCallbackHandler):
+    """Counts LLM and tool events so a UI can render live progress.
+
+    The counter is a plain int incremented from the worker thread running
+    the pipeline; a polling thread can read it without locking.
+    """
+
+    def __init__(self):
+        self.events = 0
+
+    def on_llm_start(self, serialized, prompts, **kwargs):
+        self.events += 1
+
+    def on_llm_new_token(self, token, **kwargs):
+        self.events += 1
+
+    def on_tool_end(self, output, **kwargs):
+        self.events += 1
+
+
+def _write_file(path: str, content: str) -> None:
+    with open(path, "w") as f:
+        f.write(content)
+
+
+class ResearchSummary(BaseModel):
+    """Dense research summary passed to downstream stages instead of the full report."""
+
+    industry_segment: str = Field(description="Industry classification and segment details")
+    key_products: str = Field(description="Key products/services and business model")
+    tech_infra: str = Field(description="Current technological infrastructure and digital maturity")
+    pain_points: str = Field(description="Major challenges and pain points in operations")
+
+
+class FusedAnalysisOutput(BaseModel):
+    """The three analysis sections produced by a single fused LLM call."""
+
+    research: str = Field(description="Structured industry research report in markdown")
+    use_cases: str = Field(description="Prioritized AI/ML/GenAI use cases in markdown")
+    resources: str = Field(description="Implementation resources with links in markdown")
+
+
+class IndustryResearchAgent:
+    """Agent responsible for researching industry and company information."""
+    
+    def __init__(self, model_name=None):
+        self.model_name = model_name or RESEARCH_MODEL
+        self.search_tool = SHARED_SEARCH
+
+    @cached_property
+    def llm(self):
+        return ChatOpenAI(model_name=self.model_name, temperature=0.2, streaming=True, http_async_client=SHARED_HTTP_CLIENT)
+
+    @cached_property
+    def prompt(self):
+        # The system message is fully static so OpenAI can cache the prompt
+        # prefix across calls; all dynamic values go into the human message.
+        research_instructions = """You are an Industry Research Agent specialized in gathering comprehensive information about companies and industries.
+
+Task: Research the specified company or industry thoroughly.
+
+Detailed Instructions:
+1. Use the web search results provided to analyze the company/industry thoroughly
+2. Focus on identifying:
+   - Industry classification and segment details
+   - Key products/services and business model
+   - Strategic focus areas and priorities
+   - Current technological infrastructure and digital maturity
+   - Major challenges and pain points in operations
+   - Competitive landscape and market position
+   - Recent initiatives or transformations
+
+For each finding, cite the source of information if possible.
+
+Format the output as a structured report with clear sections and bullet points. Include a brief executive summary at the beginning. Provide a detailed analysis with sections on industry overview, business model, tech infrastructure, and strategic priorities."""
+
+        return ChatPromptTemplate.from_messages([
+            ("system", research_instructions + SHARED_PROMPT_GUIDANCE),
+            ("human", """Context Given: {context}
+
+Web Search Results:
+{search_results}
+
+Please begin your research on: {query}""")
+        ])
+
+    @cached_property
+    def chain(self):
+        return self.prompt | self.llm
+
+    @cached_property
+    def summary_prompt(self):
+        # Downstream stages re-send the research in every prompt, so a dense
+        # structured summary stands in for the full prose report there.
+        summary_instructions = """Condense the industry research report into its industry segment, key products, technical infrastructure, and pain points. Pack the most decision-relevant facts into each field and keep the whole summary under roughly 200 tokens."""
+
+        return ChatPromptTemplate.from_messages([
+            ("system", summary_instructions),
+            ("human", "{research}")
+        ])
+
+    @cached_property
+    def summary_chain(self):
+        return self.summary_prompt | self.llm.with_structured_output(ResearchSummary)
+
+    async def research(self, company_or_industry: str, context: str = "", callbacks=None) -> Dict[str, Any]:
+        """Conduct research on the specified company or industry."""
+        queries = [
+            f"{company_or_industry} industry overview business model",
+            f"{company_or_industry} technology infrastructure digital maturity",
+            f"{company_or_industry} challenges competitive landscape recent initiatives"
+        ]
+        search_results = "\n\n".join(await batched_search(queries))
+        result = await self.chain.ainvoke({
+            "query": company_or_industry,
+            "context": context,
+            "search_results": search_results
+        }, config={"callbacks": callbacks} if callbacks else None)
+
+        summary = await self.summary_chain.ainvoke(
+            {"research": result.content},
+            config={"callbacks": callbacks} if callbacks else None
+        )
+
+        return {
+            "research_results": result.content,
+            "research_summary": summary.model_dump_json(),
+            "company_or_industry": company_or_industry
+        }
+
+
+class UseCaseGenerationAgent:
+    """Agent responsible for generating AI/ML/GenAI use cases based on industry research."""
+    
+    def __init__(self, model_name=None):
+        self.model_name = model_name or USE_CASE_MODEL
+        self.search_tool = SHARED_SEARCH
+
+    @cached_property
+    def llm(self):
+        return ChatOpenAI(model_name=self.model_name, temperature=0.7, streaming=True, http_async_client=SHARED_HTTP_CLIENT)
+
+    @cached_property
+    def prompt(self):
+        usecase_instructions = """You are a Use Case Generation Agent specialized in identifying valuable AI and GenAI applications for businesses.
+
+Task: Generate relevant, high-impact AI/ML/GenAI use cases for the company/industry based on the research provided.
+
+Detailed Instructions:
+1. Analyze the industry research to identify key pain points and opportunities
+2. Take current AI/ML adoption trends in this specific industry into account
+3. Generate concrete use cases in these categories:
+   - Operations optimization and efficiency
+   - Customer experience enhancement
+   - Decision support and business intelligence
+   - Predictive maintenance and analytics
+   - Process automation and workflow optimization
+   - Document intelligence and knowledge management
+   - Other industry-specific applications
+
+For each use case:
+- Provide a clear title and concise description
+- Explain the specific business problem it solves
+- Outline expected benefits and potential ROI areas
+- Rate implementation complexity (Low/Medium/High)
+- Note any prerequisites or challenges
+- Reference similar implementations in the industry where possible
+
+Focus on practical, feasible solutions rather than speculative applications.
+
+Present use cases in a structured format with clear categorization and prioritization."""
+
+        return ChatPromptTemplate.from_messages([
+            ("system", usecase_instructions + SHARED_PROMPT_GUIDANCE),
+            ("human", """Industry Research: {research}
+
+Additional Context: {context}
+
+Please generate AI/ML/GenAI use cases for: {company_or_industry}""")
+        ])
+
+    @cached_property
+    def chain(self):
+        return self.prompt | self.llm
+
+    async def search_industry_trends(self, company_or_industry: str) -> str:
+        """Search AI/ML adoption trends for the industry, independently of the research stage."""
+        return await bounded_search(f"AI ML adoption trends {company_or_industry} industry")
+
+    async def generate_use_cases(self, research_results: Dict[str, Any], context: str = "", callbacks=None) -> Dict[str, Any]:
+        """Generate AI/ML/GenAI use cases based on research results."""
+        result = await self.chain.ainvoke({
+            "research": research_results.get("research_summary") or research_results["research_results"],
+            "context": context,
+            "company_or_industry": research_results["company_or_industry"]
+        }, config={"callbacks": callbacks} if callbacks else None)
+
+        return {
+            "use_cases": result.content,
+            "company_or_industry": research_results["company_or_industry"]
+        }
+
+
+class ResourceCollectionAgent:
+    """Agent responsible for collecting resources and datasets for implementing AI use cases."""
+    
+    def __init__(self, model_name=None):
+        self.model_name = model_name or RESOURCE_MODEL
+        self.search_tool = SHARED_SEARCH
+
+    @cached_property
+    def llm(self):
+        return ChatOpenAI(model_name=self.model_name, temperature=0.2, streaming=True, http_async_client=SHARED_HTTP_CLIENT)
+
+    @cached_property
+    def prompt(self):
+        resource_instructions = """You are a Resource Collection Agent specialized in finding relevant datasets and implementation resources for AI/ML/GenAI projects.
+
+Task: Collect and organize datasets, code repositories, tutorials, and other resources for implementing the proposed AI use cases.
+
+Detailed Instructions:
+1. For each proposed use case, identify from the search results:
+   - Relevant datasets from Kaggle, HuggingFace, GitHub, etc.
+   - Pre-trained models or APIs that could be leveraged
+   - Implementation tutorials or guides
+   - Academic papers or case studies on similar applications
+   - Open-source tools that could accelerate development
+
+2. For each resource:
+   - Provide the full, clickable URL
+   - Include a brief description of the resource
+   - Explain how it relates to the specific use case
+   - Note any limitations or considerations
+
+3. Additionally, suggest GenAI-specific solutions like:
+   - Document search and retrieval systems
+   - Automated report generation
+   - AI-powered chat systems for internal or customer-facing use
+   - Knowledge extraction from unstructured data
+
+Ensure all links are valid and directly accessible.
+
+Organize resources by use case category with clear links and descriptions."""
+
+        return ChatPromptTemplate.from_messages([
+            ("system", resource_instructions + SHARED_PROMPT_GUIDANCE),
+            ("human", """Use Cases: {use_cases}
+
+Additional Context: {context}
+
+Resource Search Results:
+{search_results}
+
+Please collect resources for implementing AI/ML/GenAI use cases for: {company_or_industry}""")
+        ])
+
+    @cached_property
+    def chain(self):
+        return self.prompt | self.llm
+
+    async def collect_resources(self, use_case_results: Dict[str, Any], context: str = "", callbacks=None) -> Dict[str, Any]:
+        """Collect resources for implementing the proposed AI use cases."""
+        company_or_industry = use_case_results["company_or_industry"]
+        queries = [
+            f"datasets Kaggle HuggingFace AI ML {company_or_industry}",
+            f"open source tools implementation tutorials AI ML {company_or_industry}"
+        ]
+        search_results = "\n\n".join(await batched_search(queries))
+        result = await self.chain.ainvoke({
+            "use_cases": use_case_results["use_cases"],
+            "context": context,
+            "company_or_industry": company_or_industry,
+            "search_results": search_results
+        }, config={"callbacks": callbacks} if callbacks else None)
+
+        return {
+            "resources": result.content,
+            "company_or_industry": company_or_industry,
+            "use_cases": use_case_results["use_cases"]
+        }
+
+
+class FusedAnalysisAgent:
+    """Agent that produces research, use cases, and resources in a single LLM call.
+
+    The three analytical stages otherwise cost three API round-trips, with each
+    prompt re-sending the previous stage's full output. Once the searches are
+    pre-fetched, one call can produce all three sections.
+    """
+
+    def __init__(self, model_name=None):
+        self.model_name = model_name or FUSED_ANALYSIS_MODEL
+        self.search_tool = SHARED_SEARCH
+
+    @cached_property
+    def llm(self):
+        return ChatOpenAI(model_name=self.model_name, temperature=0.4, streaming=True, http_async_client=SHARED_HTTP_CLIENT)
+
+    @cached_property
+    def prompt(self):
+        fused_instructions = """You are an AI consulting analyst producing a three-part analysis for a company or industry.
+
+Return a JSON object with exactly three string fields, each containing markdown:
+
+- research: A structured industry research report: industry classification and segment, key products/services and business model, strategic priorities, technological infrastructure and digital maturity, major operational challenges and pain points, competitive landscape, recent initiatives. Start with a brief executive summary and cite sources from the search results where possible.
+
+- use_cases: Concrete, high-impact AI/ML/GenAI use cases grounded in the research above, covering operations optimization, customer experience, decision support, predictive analytics, process automation, document intelligence, and industry-specific applications. For each: title, description, business problem solved, expected benefits, implementation complexity (Low/Medium/High), and prerequisites.
+
+- resources: For each use case category: relevant datasets (Kaggle, HuggingFace, GitHub), pre-trained models or APIs, implementation tutorials, and open-source tools, each with a full clickable URL and a brief description of how it applies."""
+
+        return ChatPromptTemplate.from_messages([
+            ("system", fused_instructions + SHARED_PROMPT_GUIDANCE),
+            ("human", """Additional Context: {context}
+
+Web Search Results:
+{search_results}
+
+Please produce the analysis for: {query}""")
+        ])
+
+    @cached_property
+    def chain(self):
+        # Structured output pins the schema through function calling, so the
+        # three sections no longer need to be parsed out of free text.
+        return self.prompt | self.llm.with_structured_output(FusedAnalysisOutput)
+
+    async def gather_search_results(self, company_or_industry: str) -> str:
+        """Pre-fetch every search the fused analysis needs, concurrently."""
+        queries = [
+            f"{company_or_industry} industry overview business model",
+            f"{company_or_industry} technology infrastructure digital maturity",
+            f"{company_or_industry} challenges competitive landscape recent initiatives",
+            f"AI ML adoption trends {company_or_industry} industry",
+            f"datasets Kaggle HuggingFace open source tools AI ML {company_or_industry}"
+        ]
+        return "\n\n".join(await batched_search(queries))
+
+    def package_results(self, company_or_industry: str, output: "FusedAnalysisOutput") -> Dict[str, Any]:
+        """Reshape a fused response into the stage-shaped result dicts."""
+        return {
+            "research_results": {
+                "research_results": output.research,
+                "company_or_industry": company_or_industry
+            },
+            "use_case_results": {
+                "use_cases": output.use_cases,
+                "company_or_industry": company_or_industry
+            },
+            "resource_results": {
+                "resources": output.resources,
+                "company_or_industry": company_or_industry,
+                "use_cases": output.use_cases
+            }
+        }
+
+    async def analyze(self, company_or_industry: str, context: str = "", callbacks=None) -> Dict[str, Any]:
+        """Run the fused analysis; returns {} when the structured response cannot be parsed."""
+        search_results = await self.gather_search_results(company_or_industry)
+        try:
+            result = await self.chain.ainvoke({
+                "query": company_or_industry,
+                "context": context,
+                "search_results": search_results
+            }, config={"callbacks": callbacks} if callbacks else None)
+        except (ValidationError, OutputParserException):
+            return {}
+        # The parser returns None when the model emits no function call.
+        if result is None:
+            return {}
+        return self.package_results(company_or_industry, result)
+
+
+class FinalProposalGenerator:
+    """Component responsible for generating the final proposal with prioritized use cases and resources."""
+    
+    def __init__(self, model_name=None):
+        self.model_name = model_name or PROPOSAL_MODEL
+
+    @cached_property
+    def llm(self):
+        return ChatOpenAI(model_name=self.model_name, temperature=0.3, http_async_client=SHARED_HTTP_CLIENT)
+
+
+    # Static instructions first so the prompt prefix stays cacheable; the
+    # stage outputs are appended in the human message.
+    PROPOSAL_INSTRUCTIONS = """Generate a comprehensive final proposal for AI/GenAI implementation opportunities for the specified company or industry.
+
+The proposal should include:
+
+1. Executive Summary:
+   - Brief overview of the company or industry
+   - Key opportunities identified for AI/GenAI implementation
+   - Expected benefits and strategic alignment
+
+2. Industry and Company Analysis (based on the research provided)
+
+3. Prioritized AI/GenAI Use Cases (based on the use cases provided)
+
+4. Implementation Resources (based on the resources provided)
+
+5. Implementation Roadmap:
+   - Recommended sequence of use case implementation
+   - Key dependencies and prerequisites
+   - Estimated timeline and resource requirements
+
+6. Expected Outcomes:
+   - Business impact metrics
+   - ROI considerations
+   - Competitive advantages
+
+Format this as a professional proposal with clear section headers, concise bullet points, and visual separation between sections. Ensure all resource links are properly formatted as clickable links."""
+
+    def _build_proposal_prompt(self, research_results: Dict[str, Any],
+                               use_case_results: Dict[str, Any],
+                               resource_results: Dict[str, Any]) -> List:
+        """Assemble the proposal messages from the outputs of the three prior stages."""
+        return [
+            ("system", self.PROPOSAL_INSTRUCTIONS + SHARED_PROMPT_GUIDANCE),
+            ("human", f"""Company or Industry: {research_results['company_or_industry']}
+
+Industry and Company Analysis:
+{research_results.get('research_summary') or research_results['research_results']}
+
+AI/GenAI Use Cases:
+{use_case_results['use_cases']}
+
+Implementation Resources:
+{resource_results['resources']}
+
+Please generate the final proposal.""")
+        ]
+
+    async def stream_proposal(self, research_results: Dict[str, Any],
+                              use_case_results: Dict[str, Any],
+                              resource_results: Dict[str, Any]):
+        """Stream the final proposal chunk by chunk as the model generates it."""
+        proposal_prompt = self._build_proposal_prompt(research_results, use_case_results, resource_results)
+        async for chunk in self.llm.astream(proposal_prompt):
+            yield chunk.content
+
+    async def generate_proposal(self, research_results: Dict[str, Any],
+                                use_case_results: Dict[str, Any],
+                                resource_results: Dict[str, Any]) -> str:
+        """Generate the full proposal by draining the streamed chunks."""
+        chunks = [chunk async for chunk in self.stream_proposal(research_results, use_case_results, resource_results)]
+        return "".join(chunks)
+
+
+# Process-wide agent singletons: CLI loops over many companies reuse one
+# instance per stage instead of rebuilding prompts and clients each time.
+@lru_cache(maxsize=1)
+def get_fused_analysis_agent() -> FusedAnalysisAgent:
+    return FusedAnalysisAgent()
+
+@lru_cache(maxsize=1)
+def get_industry_agent() -> IndustryResearchAgent:
+    return IndustryResearchAgent()
+
+@lru_cache(maxsize=1)
+def get_use_case_agent() -> UseCaseGenerationAgent:
+    return UseCaseGenerationAgent()
+
+@lru_cache(maxsize=1)
+def get_resource_agent() -> ResourceCollectionAgent:
+    return ResourceCollectionAgent()
+
+@lru_cache(maxsize=1)
+def get_proposal_generator() -> FinalProposalGenerator:
+    return FinalProposalGenerator()
+
+
+class BatchLLMRunner:
+    """Runs chat completions through OpenAI's Batch API for a ~50% cost discount.
+
+    Only suitable for the non-interactive CLI path: a batch can take minutes
+    to hours to complete, and the runner blocks while polling.
+    """
+
+    TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+    def __init__(self, poll_interval: int = 30):
+        self.client = OpenAI()
+        self.poll_interval = poll_interval
+
+    @staticmethod
+    def _messages_to_dicts(messages) -> List[Dict[str, str]]:
+        """Convert LangChain messages or (role, content) tuples to API dicts."""
+        dicts = []
+        for message in messages:
+            if isinstance(message, tuple):
+                role, content = message
+            else:
+                role, content = message.type, message.content
+            dicts.append({"role": "user" if role == "human" else role, "content": content})
+        return dicts
+
+    def complete(self, custom_id: str, model: str, messages, temperature: float,
+                 response_format: Dict[str, str] = None) -> str:
+        """Submit one chat completion as a batch job, poll, and return the content."""
+        body = {
+            "model": model,
+            "messages": self._messages_to_dicts(messages),
+            "temperature": temperature
+        }
+        if response_format:
+            body["response_format"] = response_format
+        request = {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": body
+        }
+        batch_file = self.client.files.create(
+            file=io.BytesIO(json.dumps(request).encode()),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+
+        while batch.status not in self.TERMINAL_STATUSES:
+            print(f"Batch {custom_id}: {batch.status}, polling again in {self.poll_interval}s...")
+            time.sleep(self.poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {custom_id} finished with status '{batch.status}'")
+
+        # A "completed" batch can still carry a failed request: the result
+        # then lands in the error file and output_file_id is None.
+        if not batch.output_file_id:
+            detail = ""
+            if batch.error_file_id:
+                detail = f": {self.client.files.content(batch.error_file_id).text.strip()}"
+            raise RuntimeError(f"Batch {custom_id} completed without output{detail}")
+
+        output = self.client.files.content(batch.output_file_id).text
+        response = json.loads(output.splitlines()[0])
+        if response.get("error"):
+            raise RuntimeError(f"Batch {custom_id} request failed: {response['error']}")
+        return response["response"]["body"]["choices"][0]["message"]["content"]
+
+
+class AIUseCaseGenerationSystem:
+    """Main system coordinating the multi-agent workflow for AI use case generation."""
+    
+    def __init__(self):
+        self.fused_analysis_agent = get_fused_analysis_agent()
+        self.industry_research_agent = get_industry_agent()
+        self.use_case_generation_agent = get_use_case_agent()
+        self.resource_collection_agent = get_resource_agent()
+        self.final_proposal_generator = get_proposal_generator()
+
+    async def run_analysis_stages(self, company_or_industry: str, context: str = "") -> Dict[str, Any]:
+        """Run research, use case generation, and resource collection.
+
+        Tries the fused single-call analysis first and falls back to the
+        staged pipeline if the response cannot be split into sections.
+        """
+        print(f"\n{'='*80}\nRunning fused analysis for: {company_or_industry}\n{'='*80}\n")
+        stage_results = await self.fused_analysis_agent.analyze(company_or_industry, context)
+        if stage_results:
+            return stage_results
+
+        print(f"\n{'='*80}\nFused analysis failed to parse, starting staged research\n{'='*80}\n")
+        # The trends search is independent of the research stage, so both run concurrently
+        research_results, industry_trends = await asyncio.gather(
+            self.industry_research_agent.research(company_or_industry, context),
+            self.use_case_generation_agent.search_industry_trends(company_or_industry)
+        )
+
+        print(f"\n{'='*80}\nGenerating use cases based on research\n{'='*80}\n")
+        use_case_context = f"{context}\n\nCurrent industry AI trends:\n{industry_trends}".strip()
+        use_case_results = await self.use_case_generation_agent.generate_use_cases(research_results, use_case_context)
+
+        print(f"\n{'='*80}\nCollecting implementation resources\n{'='*80}\n")
+        resource_results = await self.resource_collection_agent.collect_resources(use_case_results, context)
+
+        return {
+            "research_results": research_results,
+            "use_case_results": use_case_results,
+            "resource_results": resource_results
+        }
+
+    async def run_batched(self, company_or_industry: str, context: str = "") -> Dict[str, Any]:
+        """Run the pipeline through the Batch API: fused analysis, then proposal.
+
+        Falls back to the live staged pipeline if the fused batch response
+        cannot be split into sections.
+        """
+        runner = BatchLLMRunner()
+        fused = self.fused_analysis_agent
+
+        print(f"\n{'='*80}\nSubmitting fused analysis batch for: {company_or_industry}\n{'='*80}\n")
+        search_results = await fused.gather_search_results(company_or_industry)
+        messages = fused.prompt.format_messages(
+            query=company_or_industry,
+            context=context,
+            search_results=search_results
+        )
+        content = await asyncio.to_thread(
+            runner.complete, "fused_analysis", fused.llm.model_name, messages, fused.llm.temperature,
+            {"type": "json_object"}
+        )
+        try:
+            stage_results = fused.package_results(
+                company_or_industry, FusedAnalysisOutput.model_validate_json(content)
+            )
+        except ValidationError:
+            print(f"\n{'='*80}\nBatch response failed validation, falling back to live pipeline\n{'='*80}\n")
+            stage_results = await self.run_analysis_stages(company_or_industry, context)
+
+        print(f"\n{'='*80}\nSubmitting final proposal batch\n{'='*80}\n")
+        generator = self.final_proposal_generator
+        proposal_messages = generator._build_proposal_prompt(
+            stage_results["research_results"],
+            stage_results["use_case_results"],
+            stage_results["resource_results"]
+        )
+        stage_results["final_proposal"] = await asyncio.to_thread(
+            runner.complete, "final_proposal", generator.llm.model_name, proposal_messages, generator.llm.temperature
+        )
+        return stage_results
+
+    async def run(self, company_or_industry: str, context: str = "", use_batch: bool = False) -> Dict[str, Any]:
+        """Run the complete workflow to generate AI use cases and implementation resources."""
+
+        if use_batch:
+            stage_results = await self.run_batched(company_or_industry, context)
+        else:
+            stage_results = await self.run_analysis_stages(company_or_industry, context)
+        research_results = stage_results["research_results"]
+        use_case_results = stage_results["use_case_results"]
+        resource_results = stage_results["resource_results"]
+        
+        if "final_proposal" in stage_results:
+            final_proposal = stage_results["final_proposal"]
+        else:
+            print(f"\n{'='*80}\nGenerating final proposal\n{'='*80}\n")
+            final_proposal = await self.final_proposal_generator.generate_proposal(
+                research_results,
+                use_case_results,
+                resource_results
+            )
+        
+        # Save results to files
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        company_slug = company_or_industry.lower().replace(" ", "_")
+        markdown_path = f"{company_slug}_{timestamp}_proposal.md"
+        html_path = f"{company_slug}_{timestamp}_proposal.html"
+
+        def write_html():
+            # The whole proposal is converted in one pass: block-level
+            # constructs (loose lists, indented continuations, reference
+            # links) span blank lines, so splitting first corrupts them.
+            MARKDOWN_CONVERTER.reset()
+            with open(html_path, "w") as f:
+                f.write(HTML_HEADER_TEMPLATE.render(company_or_industry=company_or_industry))
+                f.write(MARKDOWN_CONVERTER.convert(final_proposal))
+                f.write("\n")
+                f.write(HTML_FOOTER_TEMPLATE.render(
+                    generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                ))
+
+        # Both writes run in worker threads so the markdown conversion
+        # overlaps with the markdown file write.
+        await asyncio.gather(
+            asyncio.to_thread(_write_file, markdown_path, final_proposal),
+            asyncio.to_thread(write_html)
+        )
+        
+        return {
+            "research_results": research_results,
+            "use_case_results": use_case_results,
+            "resource_results": resource_results,
+            "final_proposal": final_proposal,
+            "files": {
+                "markdown": markdown_path,
+                "html": html_path
+            }
+        }
+
+# Command line interface
+def main():
+    parser = argparse.ArgumentParser(description='Generate AI/ML/GenAI use cases for a company or industry')
+    parser.add_argument('company_or_industry', type=str, help='Name of the company or industry to analyze')
+    parser.add_argument('--context', type=str, default='', help='Additional context or requirements')
+    parser.add_argument('--batch', action='store_true',
+                        help='Submit LLM calls through the OpenAI Batch API (~50%% cheaper, but slower)')
+
+    args = parser.parse_args()
+
+    system = AIUseCaseGenerationSystem()
+    results = asyncio.run(system.run(args.company_or_industry, args.context, use_batch=args.batch))
+    
+    print(f"\n{'='*80}")
+    print(f"Process complete! Files saved:")
+    print(f"- Markdown: {results['files']['markdown']}")
+    print(f"- HTML: {results['files']['html']}")
+    print(f"{'='*80}\n")
+
+if __name__ == "__main__":
+    main()